@@ -1,31 +1,121 @@
 import os
-import json
+import sys
+import orjson
 import time
-import base64
 import asyncio
+import queue
+import atexit
 import logging
-import traceback
-from typing import Dict, Any, Optional, Callable, List
+import logging.handlers
+from typing import Dict, Any, Optional, Callable, List, Union
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+# 优先使用SIMD加速的pybase64，接口与标准库一致
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
 # 创建日志目录
 os.makedirs("logs", exist_ok=True)
 
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("logs/web_translate_client.log", encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# 配置日志：事件循环中只将日志记录放入队列，由后台线程写入文件和控制台
+# 与logging.basicConfig一致，根日志器已有处理器时不做任何配置
+_root_logger = logging.getLogger()
+if not _root_logger.handlers:
+    _log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    _file_handler = logging.FileHandler("logs/web_translate_client.log", encoding='utf-8')
+    _file_handler.setFormatter(_log_formatter)
+    _stream_handler = logging.StreamHandler()
+    _stream_handler.setFormatter(_log_formatter)
+    
+    # QueueHandler只保留消息文本，最终格式由监听线程中的处理器负责
+    _log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(_log_queue)
+    _queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    _root_logger.addHandler(_queue_handler)
+    _root_logger.setLevel(logging.INFO)
+    
+    _log_listener = logging.handlers.QueueListener(_log_queue, _file_handler, _stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
+
+def run(main):
+    """
+    运行协程入口，供应用启动时使用以替代asyncio.run
+    
+    非Windows平台安装了uvloop时使用uvloop事件循环，否则使用asyncio默认实现。
+    不修改全局事件循环策略。
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
+
+
 class WebTranslateClient:
-    """阿里云DashScope WebSocket客户端，用于实时语音翻译"""
+    """
+    阿里云DashScope WebSocket客户端，用于实时语音翻译
+    
+    如需使用uvloop事件循环，请在应用入口用本模块的run(main())代替asyncio.run(main())。
+    """
+    
+    __slots__ = (
+        'api_key', 'target_language', 'voice', 'audio_enabled', 'model_id', 'binary_mode', 'msgpack_mode',
+        'websocket', 'is_connected', 'use_msgpack',
+        'on_text_callback', 'on_audio_callback', 'on_error_callback', 'on_close_callback', 'on_open_callback',
+        'last_activity_time', 'last_receive_time', '_loop',
+        'heartbeat_task', 'receive_task', 'flush_task', 'writer_task', '_send_queue',
+        '_audio_buffer', '_audio_flush_interval', '_audio_pending',
+        '_audio_prefix', '_audio_suffix', '_image_prefix', '_image_suffix',
+        '_init_template', '_init_template_key', '_dispatch'
+    )
+    
+    # 连接空闲多少秒后发送心跳
+    HEARTBEAT_IDLE_SECONDS = 30
+    # 多少秒未收到服务器消息视为接收超时
+    RECEIVE_TIMEOUT_SECONDS = 60
+    # 音频缓冲区超过该字节数时立即合并发送
+    AUDIO_FLUSH_BYTES = 4096
+    # 发送队列最大消息数，队列满时发送方等待，避免链路阻塞时内存无限增长
+    SEND_QUEUE_MAXSIZE = 64
+    # 关闭连接时等待发送队列写完的最长时间（秒）
+    SEND_DRAIN_TIMEOUT = 5
+    
+    # WebSocket连接缓冲区参数：DashScope消息较小，限制接收队列以降低每个连接的内存占用
+    WS_MAX_SIZE = 2 ** 20
+    WS_MAX_QUEUE = 8
+    WS_READ_LIMIT = 2 ** 16
+    WS_WRITE_LIMIT = 2 ** 16
+    
+    # 二进制帧协议的类型标记（首字节）
+    _AUDIO_TAG = b'\x01'
+    _IMAGE_TAG = b'\x02'
+    # 以"{"开头的二进制帧视为未带标记的JSON消息，与类型标记不冲突
+    _JSON_TAG = b'{'
+    
+    # 固定内容的控制消息，预先序列化（JSON协议以str发送，保持为文本帧）
+    _END_FRAME = '{"input":{"end":true}}'
+    _HEARTBEAT_FRAME = '{"type":"heartbeat"}'
+    _MSGPACK_END_FRAME = msgpack.packb({"input": {"end": True}}) if msgpack is not None else None
+    _MSGPACK_HEARTBEAT_FRAME = msgpack.packb({"type": "heartbeat"}) if msgpack is not None else None
+    
+    # 音频字段标记，用于在解析前直接从原始bytes消息中截取Base64音频
+    _AUDIO_FIELD = b'"audio":"'
     
     def __init__(
         self,
@@ -33,7 +123,10 @@ class WebTranslateClient:
         target_language: str = "zh-Hans",
         voice: str = "zh-CN-YunxiNeural",
         audio_enabled: bool = True,
-        model_id: str = "qwen-audio-turbo"
+        model_id: str = "qwen-audio-turbo",
+        binary_mode: bool = False,
+        msgpack_mode: bool = False,
+        audio_flush_interval: float = 0
     ):
         """
         初始化WebTranslateClient
@@ -44,22 +137,63 @@ class WebTranslateClient:
             voice: 语音合成音色
             audio_enabled: 是否启用音频输出
             model_id: 使用的模型ID
+            binary_mode: 是否使用二进制帧协议发送音频/图像（需服务器支持，默认使用JSON+Base64），
+                初始化、心跳、结束等控制消息始终以JSON文本帧发送
+            msgpack_mode: 是否协商msgpack子协议（需安装msgpack且服务器支持，服务器未接受时回退到JSON），
+                不能与binary_mode同时启用
+            audio_flush_interval: 音频分片合并发送的时间窗口（秒），默认0表示每个分片立即发送，
+                设为大于0的值（如0.08）启用合并发送，会增加最多该时长的延迟
         """
+        if binary_mode and msgpack_mode:
+            raise ValueError("binary_mode与msgpack_mode不能同时启用")
+        if msgpack_mode and msgpack is None:
+            raise ImportError("启用msgpack_mode需要安装msgpack")
+        
         self.api_key = api_key
         self.target_language = target_language
         self.voice = voice
         self.audio_enabled = audio_enabled
         self.model_id = model_id
+        self.binary_mode = binary_mode
+        self.msgpack_mode = msgpack_mode
         self.websocket = None
         self.is_connected = False
+        self.use_msgpack = False
         self.on_text_callback = None
         self.on_audio_callback = None
         self.on_error_callback = None
         self.on_close_callback = None
         self.on_open_callback = None
-        self.last_activity_time = time.time()
+        # 活动时间使用事件循环的单调时钟，连接时才能获取事件循环
+        self._loop = None
+        self.last_activity_time = 0.0
+        self.last_receive_time = 0.0
         self.heartbeat_task = None
         self.receive_task = None
+        self.flush_task = None
+        self.writer_task = None
+        self._send_queue = None
+        
+        # 音频微批缓冲：短时间内的多个小分片合并为一条消息发送
+        self._audio_buffer = bytearray()
+        self._audio_flush_interval = audio_flush_interval
+        # 事件对象会绑定到首次使用它的事件循环，因此在connect()中按连接创建
+        self._audio_pending = None
+        
+        # 预先构建音频/图像消息的JSON外壳，发送时与Base64数据一次拼接
+        self._audio_prefix = b'{"input":{"audio":{"data":"'
+        self._audio_suffix = b'"}}}'
+        self._image_prefix = b'{"input":{"image":{"data":"'
+        self._image_suffix = b'"}}}'
+        
+        # 初始化消息模板（不含task_id），首次发送时按当前配置生成并缓存
+        self._init_template = None
+        self._init_template_key = None
+        
+        # 按type字段分发的控制消息处理表（输出/错误消息按顶层字段判断）
+        self._dispatch = {
+            "heartbeat_response": self._handle_heartbeat
+        }
         
         logger.info(f"WebTranslateClient初始化 - 目标语言: {target_language}, 音色: {voice}, 音频启用: {audio_enabled}")
     
@@ -79,29 +213,55 @@ class WebTranslateClient:
                 "Content-Type": "application/json"
             }
             
+            # 清理上一次连接遗留的后台任务和音频缓冲
+            self._cancel_tasks()
+            self._audio_buffer = bytearray()
+            self._audio_pending = asyncio.Event()
+            
             logger.info(f"正在连接到DashScope WebSocket服务: {url}")
-            self.websocket = await websockets.connect(url, extra_headers=headers)
+            # 启用msgpack_mode时协商msgpack子协议，服务器未接受则回退到JSON
+            subprotocols = ["msgpack"] if self.msgpack_mode else None
+            self.websocket = await websockets.connect(
+                url,
+                extra_headers=headers,
+                subprotocols=subprotocols,
+                max_size=self.WS_MAX_SIZE,
+                max_queue=self.WS_MAX_QUEUE,
+                read_limit=self.WS_READ_LIMIT,
+                write_limit=self.WS_WRITE_LIMIT
+            )
+            self.use_msgpack = self.websocket.subprotocol == "msgpack"
+            # 先创建发送队列再标记已连接，初始化期间的发送请求会在队列中等待发送任务启动
+            self._send_queue = asyncio.Queue(maxsize=self.SEND_QUEUE_MAXSIZE)
             self.is_connected = True
-            self.last_activity_time = time.time()
+            self._loop = asyncio.get_running_loop()
+            self.last_activity_time = self._loop.time()
+            self.last_receive_time = self.last_activity_time
             logger.info("成功连接到DashScope WebSocket服务")
             
             # 发送初始化消息
             await self._send_init_message()
             
+            # 启动发送任务：所有数据消息经由队列由单一协程写出
+            self.writer_task = asyncio.create_task(self._writer_loop())
+            
             # 启动心跳任务
             self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
             
             # 启动接收任务
             self.receive_task = asyncio.create_task(self._receive_loop())
             
+            # 启动音频合并发送任务
+            if self._audio_flush_interval > 0:
+                self.flush_task = asyncio.create_task(self._audio_flush_loop())
+            
             # 调用打开回调
             if self.on_open_callback:
                 await self.on_open_callback()
                 
         except Exception as e:
             self.is_connected = False
-            logger.error(f"连接到DashScope WebSocket服务失败: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception("连接到DashScope WebSocket服务失败: %s", e)
             
             # 调用错误回调
             if self.on_error_callback:
@@ -111,87 +271,155 @@ class WebTranslateClient:
     async def _send_init_message(self):
         """发送初始化消息"""
         try:
-            init_message = {
-                "task_id": f"task_{int(time.time())}",
-                "input": {
-                    "audio": {
-                        "sample_rate": 16000,
-                        "format": "pcm",
-                        "channel": 1
-                    }
-                },
-                "parameters": {
-                    "target_language": self.target_language,
-                    "text_to_speech": {
-                        "enabled": self.audio_enabled,
-                        "voice": self.voice
-                    }
-                }
-            }
-            
-            logger.info(f"发送初始化消息: {json.dumps(init_message, ensure_ascii=False)}")
-            await self.websocket.send(json.dumps(init_message))
+            task_id = f"task_{int(time.time())}"
+            if self.use_msgpack:
+                payload = msgpack.packb({"task_id": task_id, **self._build_init_message()})
+            else:
+                # 模板以"{"开头，task_id作为首个字段直接拼接在其后，无需每次构建字典并序列化
+                # JSON协议需以str发送，websockets会将bytes作为二进制帧发送
+                payload = f'{{"task_id":"{task_id}",{self._get_init_template()[1:]}'
+                logger.info("发送初始化消息: %s", payload)
+            await self.websocket.send(payload)
             logger.info("初始化消息发送成功")
             
         except Exception as e:
-            logger.error(f"发送初始化消息失败: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception("发送初始化消息失败: %s", e)
             raise
     
+    def _build_init_message(self) -> Dict[str, Any]:
+        """按当前配置构建初始化消息（不含task_id）"""
+        return {
+            "input": {
+                "audio": {
+                    "sample_rate": 16000,
+                    "format": "pcm",
+                    "channel": 1
+                }
+            },
+            "parameters": {
+                "target_language": self.target_language,
+                "text_to_speech": {
+                    "enabled": self.audio_enabled,
+                    "voice": self.voice
+                }
+            }
+        }
+    
+    def _get_init_template(self) -> str:
+        """返回序列化后的初始化消息模板，配置变化时重新生成"""
+        key = (self.target_language, self.voice, self.audio_enabled)
+        if self._init_template is None or self._init_template_key != key:
+            self._init_template = orjson.dumps(self._build_init_message()).decode('utf-8')
+            self._init_template_key = key
+        return self._init_template
+    
+    def _heartbeat_frame(self) -> Union[str, bytes]:
+        """按协商的协议返回心跳消息：JSON协议为str（文本帧），msgpack协议为bytes（二进制帧）"""
+        return self._MSGPACK_HEARTBEAT_FRAME if self.use_msgpack else self._HEARTBEAT_FRAME
+    
+    def _decode(self, message) -> Dict[str, Any]:
+        """按协商的协议反序列化消息"""
+        if self.use_msgpack:
+            return msgpack.unpackb(message, raw=False)
+        return self._loads_json(message)
+    
+    def _loads_json(self, message) -> Dict[str, Any]:
+        """
+        解析JSON消息
+        
+        bytes消息中包含音频时，先将Base64音频从原始消息中截出，只解析剩余的小段JSON，
+        再把截出片段的memoryview放回output.audio，避免为整段Base64音频创建中间字符串。
+        str消息截取片段本身就会复制，因此直接解析。
+        """
+        if not isinstance(message, bytes):
+            return orjson.loads(message)
+        
+        start = message.find(self._AUDIO_FIELD)
+        if start < 0:
+            return orjson.loads(message)
+        
+        start += len(self._AUDIO_FIELD)
+        end = message.find(b'"', start)
+        # Base64中不应出现转义字符，出现时按普通消息完整解析
+        if end < 0 or message.find(b'\\', start, end) >= 0:
+            return orjson.loads(message)
+        
+        data = orjson.loads(message[:start] + message[end:])
+        output = data.get("output") if isinstance(data, dict) else None
+        if not isinstance(output, dict) or output.get("audio") != "":
+            return orjson.loads(message)
+        
+        output["audio"] = memoryview(message)[start:end]
+        return data
+    
     async def _heartbeat_loop(self):
-        """心跳循环，定期发送心跳消息"""
+        """心跳循环，仅在连接空闲到期时唤醒发送心跳，同时充当接收超时的看门狗"""
         try:
             while self.is_connected:
-                await asyncio.sleep(25)  # 每25秒发送一次心跳
+                # 根据最后活动时间计算下一次需要心跳/超时检查的时刻，连接繁忙时不会空转唤醒
+                now = self._loop.time()
+                delay = min(
+                    self.last_activity_time + self.HEARTBEAT_IDLE_SECONDS,
+                    self.last_receive_time + self.RECEIVE_TIMEOUT_SECONDS
+                ) - now
+                await asyncio.sleep(max(0, delay))
                 
                 if not self.is_connected:
                     logger.info("连接已关闭，停止心跳")
                     break
                 
+                now = self._loop.time()
+                
+                # 超过60秒未收到服务器消息，发送心跳检查连接
+                if now - self.last_receive_time >= self.RECEIVE_TIMEOUT_SECONDS:
+                    logger.warning("WebSocket接收超时，检查连接状态")
+                    try:
+                        await self.websocket.send(self._heartbeat_frame())
+                        self.last_activity_time = self.last_receive_time = self._loop.time()
+                        logger.info("心跳消息发送成功，连接正常")
+                    except Exception as e:
+                        logger.error(f"发送心跳消息失败，连接可能已断开: {e}")
+                        self._mark_disconnected()
+                        break
+                
                 # 检查最后活动时间，如果超过30秒没有活动，发送心跳
-                if time.time() - self.last_activity_time > 30:
+                elif now - self.last_activity_time >= self.HEARTBEAT_IDLE_SECONDS:
                     try:
-                        heartbeat_message = {"type": "heartbeat"}
                         logger.debug("发送心跳消息")
-                        await self.websocket.send(json.dumps(heartbeat_message))
-                        self.last_activity_time = time.time()
+                        await self.websocket.send(self._heartbeat_frame())
+                        self.last_activity_time = self._loop.time()
                     except Exception as e:
                         logger.error(f"发送心跳消息失败: {e}")
                         if not self.is_connected:
                             break
+                        # 发送失败时稍作等待，避免到期时间不变导致空转
+                        await asyncio.sleep(1)
         except asyncio.CancelledError:
             logger.info("心跳任务被取消")
         except Exception as e:
-            logger.error(f"心跳循环中发生错误: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception("心跳循环中发生错误: %s", e)
     
     async def _receive_loop(self):
         """接收循环，处理服务器消息"""
         try:
             while self.is_connected:
                 try:
-                    message = await asyncio.wait_for(self.websocket.recv(), timeout=60)
-                    self.last_activity_time = time.time()
+                    # 接收超时由心跳循环统一检查，这里不再为每条消息创建计时器
+                    message = await self.websocket.recv()
+                    self.last_activity_time = self.last_receive_time = self._loop.time()
+                    
+                    # 二进制帧：首字节为类型标记，负载直接交给回调
+                    if self.binary_mode and isinstance(message, bytes):
+                        await self._process_binary_message(message)
+                        continue
                     
                     # 解析消息
-                    data = json.loads(message)
+                    data = self._decode(message)
                     await self._process_message(data)
                     
-                except asyncio.TimeoutError:
-                    logger.warning("WebSocket接收超时，检查连接状态")
-                    # 发送心跳检查连接
-                    try:
-                        heartbeat_message = {"type": "heartbeat"}
-                        await self.websocket.send(json.dumps(heartbeat_message))
-                        logger.info("心跳消息发送成功，连接正常")
-                    except Exception as e:
-                        logger.error(f"发送心跳消息失败，连接可能已断开: {e}")
-                        self.is_connected = False
-                        break
-                        
                 except ConnectionClosed as e:
                     logger.warning(f"WebSocket连接已关闭: {e}")
-                    self.is_connected = False
+                    self._mark_disconnected()
                     
                     # 调用关闭回调
                     if self.on_close_callback:
@@ -200,8 +428,7 @@ class WebTranslateClient:
                     break
                     
                 except Exception as e:
-                    logger.error(f"接收或处理消息时发生错误: {e}")
-                    logger.error(f"错误详情: {traceback.format_exc()}")
+                    logger.exception("接收或处理消息时发生错误: %s", e)
                     
                     # 调用错误回调
                     if self.on_error_callback:
@@ -210,58 +437,90 @@ class WebTranslateClient:
         except asyncio.CancelledError:
             logger.info("接收任务被取消")
         except Exception as e:
-            logger.error(f"接收循环中发生错误: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception("接收循环中发生错误: %s", e)
     
     async def _process_message(self, data: Dict[str, Any]):
-        """处理接收到的消息"""
+        """处理接收到的消息，按消息类型分发到对应的处理函数"""
         try:
-            # 检查消息类型
+            # 翻译输出最频繁，优先判断，热路径只需一次字段检查
             if "output" in data:
-                output = data["output"]
-                
-                # 处理文本输出
-                if "text" in output:
-                    text = output["text"]
-                    logger.debug(f"收到文本: {text}")
-                    
-                    # 调用文本回调
-                    if self.on_text_callback:
-                        await self.on_text_callback(text)
-                
-                # 处理音频输出
-                if "audio" in output and output["audio"]:
-                    audio_data = output["audio"]
-                    logger.debug(f"收到音频数据: {len(audio_data)} 字符")
-                    
-                    # 解码Base64音频数据
-                    try:
-                        audio_bytes = base64.b64decode(audio_data)
-                        
-                        # 调用音频回调
-                        if self.on_audio_callback:
-                            await self.on_audio_callback(audio_bytes)
-                    except Exception as e:
-                        logger.error(f"解码音频数据失败: {e}")
+                await self._handle_output(data)
             
-            # 处理错误消息
             elif "error" in data:
-                error = data["error"]
-                error_code = error.get("code", "unknown")
-                error_message = error.get("message", "Unknown error")
-                logger.error(f"收到错误消息: {error_code} - {error_message}")
-                
-                # 调用错误回调
-                if self.on_error_callback:
-                    await self.on_error_callback(f"{error_code}: {error_message}")
+                await self._handle_error(data)
             
-            # 处理心跳响应
-            elif data.get("type") == "heartbeat_response":
-                logger.debug("收到心跳响应")
+            # 其余消息按type字段查表分发，未知类型忽略
+            else:
+                handler = self._dispatch.get(data.get("type"))
+                if handler:
+                    await handler(data)
                 
         except Exception as e:
-            logger.error(f"处理消息时发生错误: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception("处理消息时发生错误: %s", e)
+    
+    async def _process_binary_message(self, message: bytes):
+        """处理二进制帧消息"""
+        try:
+            tag = message[:1]
+            if tag == self._AUDIO_TAG:
+                logger.debug("收到二进制音频数据: %d bytes", len(message) - 1)
+                if self.on_audio_callback:
+                    await self.on_audio_callback(message[1:])
+            elif tag == self._JSON_TAG:
+                # 服务器以二进制帧发送的JSON消息，按普通消息处理
+                await self._process_message(self._loads_json(message))
+            else:
+                logger.warning("收到未知类型的二进制消息: %r", tag)
+                
+        except Exception as e:
+            logger.exception("处理二进制消息时发生错误: %s", e)
+    
+    async def _handle_output(self, data: Dict[str, Any]):
+        """处理翻译输出消息"""
+        output = data["output"]
+        
+        # 处理文本输出
+        if "text" in output:
+            text = output["text"]
+            logger.debug("收到文本: %s", text)
+            
+            # 调用文本回调
+            if self.on_text_callback:
+                await self.on_text_callback(text)
+        
+        # 处理音频输出
+        if "audio" in output and output["audio"]:
+            audio_data = output["audio"]
+            logger.debug("收到音频数据: %d 字符", len(audio_data))
+            
+            # 解码Base64音频数据（msgpack协议下音频已是原始bytes）
+            try:
+                if isinstance(audio_data, bytes):
+                    audio_bytes = audio_data
+                # JSON协议下为Base64字符串或从原始消息截出的片段
+                else:
+                    audio_bytes = base64.b64decode(audio_data)
+                
+                # 调用音频回调
+                if self.on_audio_callback:
+                    await self.on_audio_callback(audio_bytes)
+            except Exception as e:
+                logger.error("解码音频数据失败: %s", e)
+    
+    async def _handle_error(self, data: Dict[str, Any]):
+        """处理错误消息"""
+        error = data["error"]
+        error_code = error.get("code", "unknown")
+        error_message = error.get("message", "Unknown error")
+        logger.error("收到错误消息: %s - %s", error_code, error_message)
+        
+        # 调用错误回调
+        if self.on_error_callback:
+            await self.on_error_callback(f"{error_code}: {error_message}")
+    
+    async def _handle_heartbeat(self, data: Dict[str, Any]):
+        """处理心跳响应"""
+        logger.debug("收到心跳响应")
     
     async def send_audio_data(self, audio_data: bytes):
         """发送音频数据"""
@@ -270,31 +529,142 @@ class WebTranslateClient:
                 logger.warning("WebSocket未连接，无法发送音频数据")
                 return
             
-            # 编码为Base64
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
+            # 先写入缓冲区，达到阈值或未启用合并时立即发送，否则由合并任务定时发送
+            self._audio_buffer += audio_data
+            if self._audio_flush_interval <= 0 or len(self._audio_buffer) >= self.AUDIO_FLUSH_BYTES:
+                await self._flush_audio_buffer()
+            else:
+                self._audio_pending.set()
             
-            # 构建消息
-            message = {
-                "input": {
-                    "audio": {
-                        "data": audio_base64
-                    }
-                }
-            }
-            
-            # 发送消息
-            logger.debug(f"发送音频数据: {len(audio_data)} bytes")
-            await self.websocket.send(json.dumps(message))
-            self.last_activity_time = time.time()
+        except Exception as e:
+            logger.exception("发送音频数据失败: %s", e)
             
+            # 调用错误回调
+            if self.on_error_callback:
+                await self.on_error_callback(str(e))
+    
+    async def _flush_audio_buffer(self):
+        """将缓冲区中的音频合并为一条消息放入发送队列"""
+        if not self._audio_buffer:
+            return
+        
+        # 直接交换缓冲区，避免复制已缓冲的音频
+        audio_data = self._audio_buffer
+        self._audio_buffer = bytearray()
+        
+        if self.binary_mode:
+            # 二进制帧：类型标记 + 原始音频，无需Base64和JSON封装
+            frame = self._AUDIO_TAG + audio_data
+        elif self.use_msgpack:
+            # msgpack协议：音频以bin类型直接打包，无需Base64
+            frame = msgpack.packb({"input": {"audio": {"data": audio_data}}})
+        else:
+            # 编码为Base64并直接写入预分配的JSON消息缓冲区
+            frame = self._build_base64_frame(self._audio_prefix, audio_data, self._audio_suffix)
+        
+        # 放入发送队列
+        logger.debug("发送音频数据: %d bytes", len(audio_data))
+        await self._send_queue.put(frame)
+    
+    @staticmethod
+    def _build_base64_frame(prefix: bytes, data, suffix: bytes) -> str:
+        """将Base64数据拼接进JSON外壳，返回str以文本帧发送"""
+        return (prefix + base64.b64encode(data) + suffix).decode('ascii')
+    
+    def _mark_disconnected(self):
+        """标记连接已断开：丢弃无法再发送的缓冲音频，唤醒合并发送任务使其退出，并停止发送任务"""
+        self.is_connected = False
+        if self._audio_buffer:
+            logger.warning("连接已断开，丢弃未发送的音频数据: %d bytes", len(self._audio_buffer))
+            self._audio_buffer = bytearray()
+        if self._audio_pending is not None:
+            self._audio_pending.set()
+        if self.writer_task and not self.writer_task.done() and self.writer_task is not asyncio.current_task():
+            self.writer_task.cancel()
+    
+    def _cancel_tasks(self):
+        """取消所有后台任务（调用方所在的任务除外）"""
+        current = asyncio.current_task()
+        for task in (self.heartbeat_task, self.receive_task, self.flush_task, self.writer_task):
+            if task and not task.done() and task is not current:
+                task.cancel()
+    
+    async def _drain_send_queue(self, timeout: Optional[float] = None):
+        """等待发送队列中的消息全部写出，发送任务提前结束或超时时不再等待"""
+        if not self.writer_task or self.writer_task.done():
+            return
+        
+        join_task = asyncio.ensure_future(self._send_queue.join())
+        try:
+            done, _ = await asyncio.wait(
+                {join_task, self.writer_task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if join_task not in done:
+                logger.warning("发送队列未能全部写出，剩余消息: %d", self._send_queue.qsize())
+        finally:
+            # 超时或被外部取消时不遗留等待任务
+            join_task.cancel()
+    
+    async def _flush_and_drain(self):
+        """发送缓冲区中剩余的音频，并等待发送队列写完"""
+        await self._flush_audio_buffer()
+        await self._drain_send_queue()
+    
+    async def _audio_flush_loop(self):
+        """音频合并发送循环，缓冲区有数据时等待一个时间窗口后统一发送"""
+        try:
+            while self.is_connected:
+                await self._audio_pending.wait()
+                if not self.is_connected:
+                    break
+                await asyncio.sleep(self._audio_flush_interval)
+                self._audio_pending.clear()
+                if not self.is_connected:
+                    break
+                
+                try:
+                    await self._flush_audio_buffer()
+                except Exception as e:
+                    logger.exception("发送音频数据失败: %s", e)
+                    
+                    # 调用错误回调
+                    if self.on_error_callback:
+                        await self.on_error_callback(str(e))
+        except asyncio.CancelledError:
+            logger.info("音频发送任务被取消")
         except Exception as e:
-            logger.error(f"发送音频数据失败: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception("音频合并发送循环中发生错误: %s", e)
             
             # 调用错误回调
             if self.on_error_callback:
                 await self.on_error_callback(str(e))
     
+    async def _writer_loop(self):
+        """发送循环，按顺序将发送队列中的消息写入WebSocket"""
+        # 绑定本次连接的队列，重连后旧任务不会影响新队列
+        send_queue = self._send_queue
+        try:
+            while self.is_connected:
+                frame = await send_queue.get()
+                try:
+                    await self.websocket.send(frame)
+                    self.last_activity_time = self._loop.time()
+                except Exception as e:
+                    logger.exception("发送消息失败: %s", e)
+                    
+                    # 调用错误回调
+                    if self.on_error_callback:
+                        await self.on_error_callback(str(e))
+                finally:
+                    send_queue.task_done()
+        except asyncio.CancelledError:
+            logger.info("发送任务被取消")
+        finally:
+            # 丢弃未写出的消息，释放等待中的put和join
+            while not send_queue.empty():
+                send_queue.get_nowait()
+                send_queue.task_done()
+    
     async def send_image_frame(self, image_data: bytes):
         """发送图像帧数据（用于视频翻译）"""
         try:
@@ -302,26 +672,22 @@ class WebTranslateClient:
                 logger.warning("WebSocket未连接，无法发送图像数据")
                 return
             
-            # 编码为Base64
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
-            
-            # 构建消息
-            message = {
-                "input": {
-                    "image": {
-                        "data": image_base64
-                    }
-                }
-            }
+            if self.binary_mode:
+                # 二进制帧：类型标记 + 原始图像，无需Base64和JSON封装
+                frame = self._IMAGE_TAG + image_data
+            elif self.use_msgpack:
+                # msgpack协议：图像以bin类型直接打包，无需Base64
+                frame = msgpack.packb({"input": {"image": {"data": image_data}}})
+            else:
+                # 编码为Base64并直接写入预分配的JSON消息缓冲区
+                frame = self._build_base64_frame(self._image_prefix, image_data, self._image_suffix)
             
-            # 发送消息
-            logger.debug(f"发送图像数据: {len(image_data)} bytes")
-            await self.websocket.send(json.dumps(message))
-            self.last_activity_time = time.time()
+            # 放入发送队列
+            logger.debug("发送图像数据: %d bytes", len(image_data))
+            await self._send_queue.put(frame)
             
         except Exception as e:
-            logger.error(f"发送图像数据失败: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception("发送图像数据失败: %s", e)
             
             # 调用错误回调
             if self.on_error_callback:
@@ -334,29 +700,34 @@ class WebTranslateClient:
                 logger.warning("WebSocket未连接，无法发送结束信号")
                 return
             
-            # 构建结束消息
-            end_message = {"input": {"end": True}}
+            # 先发送缓冲区中剩余的音频
+            await self._flush_audio_buffer()
             
-            # 发送消息
+            # 放入发送队列，并等待队列中的消息全部写出，保证结束信号先于后续关闭操作发出
             logger.info("发送结束信号")
-            await self.websocket.send(json.dumps(end_message))
-            self.last_activity_time = time.time()
+            await self._send_queue.put(self._MSGPACK_END_FRAME if self.use_msgpack else self._END_FRAME)
+            await self._drain_send_queue()
             
         except Exception as e:
-            logger.error(f"发送结束信号失败: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception("发送结束信号失败: %s", e)
     
     async def close(self):
         """关闭WebSocket连接"""
         try:
             logger.info("正在关闭WebSocket连接")
             
+            # 发送缓冲区中剩余的音频并等待发送队列写完，入队与写出共用同一超时，链路阻塞时不会卡住关闭流程
+            if self.is_connected:
+                try:
+                    await asyncio.wait_for(self._flush_and_drain(), timeout=self.SEND_DRAIN_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning("等待发送队列写出超时，剩余消息将被丢弃")
+                except Exception as e:
+                    logger.exception("关闭前发送剩余消息失败: %s", e)
+            self._mark_disconnected()
+            
             # 取消任务
-            if self.heartbeat_task:
-                self.heartbeat_task.cancel()
-                
-            if self.receive_task:
-                self.receive_task.cancel()
+            self._cancel_tasks()
             
             # 关闭WebSocket连接
             if self.websocket:
@@ -366,8 +737,7 @@ class WebTranslateClient:
             logger.info("WebSocket连接已关闭")
             
         except Exception as e:
-            logger.error(f"关闭WebSocket连接时发生错误: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception("关闭WebSocket连接时发生错误: %s", e)
     
     def set_callbacks(
         self,